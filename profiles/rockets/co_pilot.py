@@ -13,32 +13,36 @@ from util.detail import REQUIRED_FLARE
 
 class CoPilotProfile(RocketProfile):
 
+    _BUTTONS = {
+        "Arm": "CO_PILOT_FLARE.ARM",
+        "Halo": "CO_PILOT_FLARE.halo",
+        "Data": "CO_PILOT_FLARE.data",
+        "Ping": "CO_PILOT_FLARE.PING"
+    }
+
+    _LABELS = [
+        Label(DeviceType.CO_PILOT_FLARE, "Altitude", update_altitude),
+        Label(DeviceType.CO_PILOT_FLARE, "MaxAltitude", update_max_altitude, "Max Altitude"),
+        Label(DeviceType.CO_PILOT_FLARE, "GPS", update_gps),
+        Label(DeviceType.CO_PILOT_FLARE, "State", update_state),
+        Label(DeviceType.CO_PILOT_FLARE, "Pressure", update_pressure),
+        Label(DeviceType.CO_PILOT_FLARE, "Acceleration", update_acceleration),
+        Label(DeviceType.CO_PILOT_FLARE, "TankPressure", update_tank_pressure, "Tank Pressure"),
+        Label(DeviceType.CO_PILOT_FLARE, "ChamberPressure", update_chamber_pressure, "Chamber Pressure"),
+        Label(DeviceType.CO_PILOT_FLARE, "ChamberTemp", update_chamber_temp, "Chamber Temperature"),
+    ]
+
     @property
     def rocket_name(self):
         return "Co-Pilot"
 
     @property
     def buttons(self):
-        return {
-            "Arm": "CO_PILOT_FLARE.ARM",
-            "Halo": "CO_PILOT_FLARE.halo",
-            "Data": "CO_PILOT_FLARE.data",
-            "Ping": "CO_PILOT_FLARE.PING"
-        }
+        return self._BUTTONS
 
     @property
     def labels(self):
-        return [
-            Label(DeviceType.CO_PILOT_FLARE, "Altitude", update_altitude),
-            Label(DeviceType.CO_PILOT_FLARE, "MaxAltitude", update_max_altitude, "Max Altitude"),
-            Label(DeviceType.CO_PILOT_FLARE, "GPS", update_gps),
-            Label(DeviceType.CO_PILOT_FLARE, "State", update_state),
-            Label(DeviceType.CO_PILOT_FLARE, "Pressure", update_pressure),
-            Label(DeviceType.CO_PILOT_FLARE, "Acceleration", update_acceleration),
-            Label(DeviceType.CO_PILOT_FLARE, "TankPressure", update_tank_pressure, "Tank Pressure"),
-            Label(DeviceType.CO_PILOT_FLARE, "ChamberPressure", update_chamber_pressure, "Chamber Pressure"),
-            Label(DeviceType.CO_PILOT_FLARE, "ChamberTemp", update_chamber_temp, "Chamber Temperature"),
-        ]
+        return self._LABELS
 
     @property
     def expected_devices(self):
@@ -2,16 +2,52 @@ import pytest
 import logging
 from typing import List, Tuple
 
+from connections.sim.sim_connection import FirmwareNotFound
+from connections.sim.hw.hw_sim import HWSim
 from main_window.data_entry_id import DataEntryIds
 from profiles.rocket_profile_list import ROCKET_PROFILES, RocketProfile
 from main_window.main_app import MainApp
 from main_window.device_manager import DeviceType, DEVICE_REGISTERED_EVENT, is_device_type_flare
 from main_window.read_thread import CONNECTION_MESSAGE_READ_EVENT
-from main_window.rocket_data import BUNDLE_ADDED_EVENT
+from main_window.rocket_data import BUNDLE_ADDED_EVENT, RocketData
 
 from util.event_stats import get_event_stats_snapshot
 
 
+def construct_test_app(profile: RocketProfile, connections, num_devices: int = None) -> MainApp:
+    """
+    Constructs an instance of main_app and waits until it is ready (i.e. all expected devices have registered).
+
+    :param profile: Rocket profile to construct app for
+    :param connections: Connections to pass to the app
+    :param num_devices: Number of devices expected to register. Defaults to the profile's expected devices.
+    :return: Constructed app
+    """
+    snapshot = get_event_stats_snapshot()
+    app = profile.construct_app(connections)
+
+    if num_devices is None:
+        expected = len(profile.expected_devices)
+    else:
+        expected = num_devices
+
+    assert DEVICE_REGISTERED_EVENT.wait(snapshot, num_expected=expected) == expected
+
+    return app
+
+
+def assert_no_error_logs(caplog):
+    """
+    Fail test if error message in logs since we catch most exceptions in app
+
+    :param caplog: fixture
+    """
+    for when in ("setup", "call"):
+        messages = [x.message for x in caplog.get_records(when) if x.levelno == logging.ERROR]
+        if messages:
+            pytest.fail(f"Errors reported in logs: {messages}")
+
+
 @pytest.fixture(scope="function")
 def test_app(caplog):
     """
@@ -26,16 +62,7 @@ def test_app(caplog):
 
     def construct(profile, connections, num_devices=None):
         nonlocal app
-        snapshot = get_event_stats_snapshot()
-        app = profile.construct_app(connections)
-
-        if num_devices is None:
-            expected = len(profile.expected_devices)
-        else:
-            expected = num_devices
-
-        assert DEVICE_REGISTERED_EVENT.wait(snapshot, num_expected=expected) == expected
-
+        app = construct_test_app(profile, connections, num_devices=num_devices)
         return app
 
     yield construct
@@ -45,11 +72,51 @@ def test_app(caplog):
     if app is not None:
         app.shutdown()
 
-    # Fail test if error message in logs since we catch most exceptions in app
-    for when in ("setup", "call"):
-        messages = [x.message for x in caplog.get_records(when) if x.levelno == logging.ERROR]
-        if messages:
-            pytest.fail(f"Errors reported in logs: {messages}")
+    assert_no_error_logs(caplog)
+
+
+@pytest.fixture(scope="function")
+def no_error_logs(caplog):
+    """
+    Per-test log check for tests sharing a module scoped app, since caplog is function scoped and so cannot be used by
+    the module scoped fixture itself.
+
+    :param caplog: fixture
+    """
+    yield
+    assert_no_error_logs(caplog)
+
+
+def reset_rocket_data(rocket_data: RocketData):
+    """
+    Clears all received data, so that tests sharing an app only see data received during the test. Registered
+    callbacks are kept.
+
+    :param rocket_data:
+    """
+    with rocket_data.data_lock:
+        rocket_data.timeset.clear()
+        rocket_data.last_time = 0
+        rocket_data.highest_altitude.clear()
+        rocket_data.existing_entry_keys.clear()
+
+
+def construct_sim_connection(profile: RocketProfile):
+    """
+    Constructs the profile's SIM connections, skipping the test if the firmware has not been built
+
+    :param profile:
+    :return: Connections for the profile
+    """
+    try:
+        return profile.construct_sim_connection()
+    except FirmwareNotFound:
+        pytest.skip("Firmware not found")
+
+
+def get_hw_sim(sim_app: MainApp, device_type: DeviceType) -> HWSim:
+    connection_name = sim_app.device_manager.get_full_address(device_type).connection_name
+    return sim_app.connections[connection_name]._hw_sim
 
 
 def flush_packets(main_app: MainApp, device_type: DeviceType):
@@ -1,6 +1,13 @@
 import pytest
 from unittest.mock import MagicMock, ANY
-from .integration_utils import test_app, valid_paramitrization, all_profiles
+from .integration_utils import (
+    test_app,
+    no_error_logs,
+    construct_test_app,
+    reset_rocket_data,
+    valid_paramitrization,
+    all_profiles,
+)
 from connections.debug.debug_connection import DebugConnection, ARMED_EVENT, DISARMED_EVENT
 from main_window.competition.comp_app import LABLES_UPDATED_EVENT
 from profiles.rockets.tantalus import TantalusProfile
@@ -27,12 +34,24 @@ from util.event_stats import get_event_stats_snapshot
 from util.detail import REQUIRED_FLARE
 
 
-@pytest.fixture(scope="function")
-def single_connection_tantalus(test_app):
-    yield test_app(TantalusProfile(), {
+@pytest.fixture(scope="module")
+def shared_single_connection_tantalus(qapp):
+    # Shared by all tests in this module to avoid repeatedly starting and stopping the app and its threads
+    app = construct_test_app(TantalusProfile(), {
         'DEBUG_CONNECTION': DebugConnection('TANTALUS_STAGE_1_ADDRESS', DEVICE_TYPE_TO_ID[DeviceType.TANTALUS_STAGE_1_FLARE], generate_radio_packets=False)
     }, num_devices=1)
 
+    yield app
+
+    app.shutdown()
+
+
+@pytest.fixture(scope="function")
+def single_connection_tantalus(shared_single_connection_tantalus, no_error_logs):
+    # Clear data left by previous tests so that assertions only pass on data received during this test
+    reset_rocket_data(shared_single_connection_tantalus.rocket_data)
+    yield shared_single_connection_tantalus
+
 
 def test_arm_signal(qtbot, single_connection_tantalus):
     app = single_connection_tantalus
@@ -68,8 +87,8 @@ def test_bulk_sensor_packet(qtbot, single_connection_tantalus):
 
     assert BUNDLE_ADDED_EVENT.wait(snapshot) == 1
 
-    def get_val(val):
-        return app.rocket_data.last_value_by_device(DeviceType.TANTALUS_STAGE_1_FLARE, val)
+    last_value = app.rocket_data.last_value_by_device
+    device = DeviceType.TANTALUS_STAGE_1_FLARE
 
     vals_to_get = (
         DataEntryIds.CALCULATED_ALTITUDE,
@@ -82,12 +101,12 @@ def test_bulk_sensor_packet(qtbot, single_connection_tantalus):
         DataEntryIds.LATITUDE,
         DataEntryIds.LONGITUDE,
     )
-    last_values = tuple(map(get_val, vals_to_get))
+    last_values = tuple(last_value(device, val) for val in vals_to_get)
 
     assert sensor_inputs[1:-1] == last_values
 
     # Special check for state
-    state_val = get_val(DataEntryIds.STATE)
+    state_val = last_value(device, DataEntryIds.STATE)
     assert STATE_IDS[state_input] == state_val
 
     assert LABLES_UPDATED_EVENT.wait(snapshot) >= 1
@@ -127,17 +146,18 @@ def test_single_sensor_packet(qtbot, single_connection_tantalus):
         (SubpacketIds.GROUND_ALTITUDE, 24),
     ]
 
-    for sensor_id, val in vals:
-        data_entry_id = DataEntryIds[sensor_id.name]
-        packet = radio_packets.single_sensor(0xFFFFFFFF, sensor_id, val)
-
-        snapshot = get_event_stats_snapshot()
+    # Send all packets up front and wait once, rather than synchronizing with the read thread after every packet
+    expected = {}
+    snapshot = get_event_stats_snapshot()
 
-        connection.receive(packet)
+    for sensor_id, val in vals:
+        expected[DataEntryIds[sensor_id.name]] = val  # Later values for the same sensor overwrite earlier ones
+        connection.receive(radio_packets.single_sensor(0xFFFFFFFF, sensor_id, val))
 
-        assert SINGLE_SENSOR_EVENT.wait(snapshot) == 1
-        assert app.rocket_data.last_value_by_device(DeviceType.TANTALUS_STAGE_1_FLARE,
-                                                    DataEntryIds.TIME) == 0xFFFFFFFF
+    assert SINGLE_SENSOR_EVENT.wait(snapshot, num_expected=len(vals)) == len(vals)
+    assert app.rocket_data.last_value_by_device(DeviceType.TANTALUS_STAGE_1_FLARE,
+                                                DataEntryIds.TIME) == 0xFFFFFFFF
+    for data_entry_id, val in expected.items():
         assert app.rocket_data.last_value_by_device(DeviceType.TANTALUS_STAGE_1_FLARE, data_entry_id) == val
 
 
@@ -233,10 +253,12 @@ def test_status_ping_packet(qtbot, single_connection_tantalus):
             app.rocket_data.last_value_by_device(DeviceType.TANTALUS_STAGE_1_FLARE, DataEntryIds.OVERALL_STATUS)
             == DataEntryValues.STATUS_CRITICAL_FAILURE
     )
+
+    last_value = app.rocket_data.last_value_by_device
     for sensor in SENSOR_TYPES:
-        assert app.rocket_data.last_value_by_device(DeviceType.TANTALUS_STAGE_1_FLARE, sensor) == 1
+        assert last_value(DeviceType.TANTALUS_STAGE_1_FLARE, sensor) == 1
     for other in OTHER_STATUS_TYPES:
-        assert app.rocket_data.last_value_by_device(DeviceType.TANTALUS_STAGE_1_FLARE, other) == 1
+        assert last_value(DeviceType.TANTALUS_STAGE_1_FLARE, other) == 1
 
 
 def test_gps_packet(qtbot, single_connection_tantalus):
@@ -1,46 +1,82 @@
-import time
 import pytest
-import numpy as np
 from pytest import approx
-from profiles.rocket_profile import RocketProfile
-from profiles.rockets.hollyburn import HollyburnProfile
-from .integration_utils import test_app, valid_paramitrization, all_devices, all_profiles, only_flare, flush_packets
-from connections.sim.sim_connection import FirmwareNotFound
-from connections.sim.hw.hw_sim import HWSim, PinModes
+from .integration_utils import (
+    no_error_logs,
+    construct_test_app,
+    construct_sim_connection,
+    get_hw_sim,
+    valid_paramitrization,
+    all_devices,
+    all_profiles,
+    only_flare,
+    flush_packets,
+)
+from connections.sim.hw.hw_sim import PinModes
 from connections.sim.hw.sensors.sensor import SensorType
 from connections.sim.hw.sensors.dummy_sensor import DummySensor
-from connections.sim.hw.rocket_sim import FlightEvent, FlightDataType
 from main_window.competition.comp_app import CompApp
 from main_window.data_entry_id import DataEntryIds, DataEntryValues
 from main_window.device_manager import DeviceType
 from main_window.packet_parser import (
     SINGLE_SENSOR_EVENT,
     CONFIG_EVENT,
-    STATE_IDS,
 )
 
 from util.event_stats import get_event_stats_snapshot
 
-S_TO_MS = int(1e3)
+# Barometric formula constants (standard atmosphere, troposphere)
+BARO_PB = 101325  # Pa
+BARO_TB = 288.15  # K
+BARO_LB = -0.0065  # K/m
+BARO_R = 8.3144598  # J/(mol K)
+BARO_G0 = 9.80665  # m/s^2
+BARO_M = 0.0289644  # kg/mol
+BARO_EXPONENT = BARO_R * BARO_LB / (BARO_G0 * BARO_M)
 
-@pytest.fixture(scope="function")
-def sim_app(test_app, request) -> CompApp:
+
+def baro_altitude(pres):
+    return BARO_TB / BARO_LB * ((BARO_PB / pres) ** BARO_EXPONENT - 1)
+
+
+@pytest.fixture(scope="module")
+def shared_sim_app(qapp, request) -> CompApp:
+    """
+    Shared by all tests in this module with the same profile, to avoid repeatedly loading the firmware and starting
+    the app and its threads. Tests that leave the app in an unusable state belong in test_sim_lifecycle.py instead.
+    """
     profile = request.param
-    try:
-        connections = profile.construct_sim_connection()
-    except FirmwareNotFound:
-        pytest.skip("Firmware not found")
-        return
+    app = construct_test_app(profile, construct_sim_connection(profile))
+
+    yield app
+
+    app.shutdown()
+
+
+@pytest.fixture(scope="function")
+def sim_app(shared_sim_app, device_type, no_error_logs) -> CompApp:
+    """
+    Restores the HW sim state that tests modify (sensors, ignitors) and returns the device to standby after each
+    test, so that tests sharing an app do not depend on the order they run in.
+    """
+    hw = get_hw_sim(shared_sim_app, device_type)
+    sensors = list(hw._sensors.values())
+    ignitor_action_fns = {ign_type: ign.action_fn for ign_type, ign in hw._ignitors.items()}
 
-    return test_app(profile, connections)
+    yield shared_sim_app
 
+    # ----- Following code is run on cleanup -----
 
-def get_hw_sim(sim_app, device_type: DeviceType) -> HWSim:
-    connection_name = sim_app.device_manager.get_full_address(device_type).connection_name
-    return sim_app.connections[connection_name]._hw_sim
+    for sensor in sensors:
+        hw.replace_sensor(sensor)
 
-def get_profile(sim_app) -> RocketProfile:
-    return sim_app.rocket_profile
+    with hw:
+        for ign_type, action_fn in ignitor_action_fns.items():
+            hw._ignitors[ign_type].action_fn = action_fn
+
+    flush_packets(shared_sim_app, device_type)
+    if shared_sim_app.rocket_data.last_value_by_device(device_type, DataEntryIds.STATE) != DataEntryValues.STATE_STANDBY:
+        shared_sim_app.send_command(device_type.name + ".disarm")
+        flush_packets(shared_sim_app, device_type)
 
 
 def set_dummy_sensor_values(sim_app, device_type: DeviceType, sensor_type: SensorType, *vals):
@@ -48,11 +84,13 @@ def set_dummy_sensor_values(sim_app, device_type: DeviceType, sensor_type: Senso
     hw.replace_sensor(DummySensor(sensor_type, tuple(vals)))
 
 
+# Module scope so that tests are grouped by profile and share shared_sim_app, instead of being treated as function
+# scoped because device_type is not indirect
 @pytest.mark.parametrize(
-    "sim_app, device_type", valid_paramitrization(
+    "shared_sim_app, device_type", valid_paramitrization(
         all_profiles(excluding=['WbProfile', 'CoPilotProfile']),
         only_flare(all_devices(excluding=[]))),
-    indirect=['sim_app'])
+    indirect=['shared_sim_app'], scope="module")
 class TestFlare:
     def test_arming(self, qtbot, sim_app, device_type):
         flush_packets(sim_app, device_type)
@@ -117,16 +155,9 @@ class TestFlare:
         assert hw.get_pin_mode(34) == PinModes.OUTPUT
 
     def test_baro_altitude(self, qtbot, sim_app, device_type):
-        Pb = 101325
-        Tb = 288.15
-        Lb = -0.0065
-        R = 8.3144598
-        g0 = 9.80665
-        M = 0.0289644
-        altitude = lambda pres: Tb / Lb * ((Pb / pres) ** (R * Lb / (g0 * M)) - 1)
-
         # Set base/ground altitude
         initial_pres = 1000
+        initial_baro_altitude = baro_altitude(initial_pres)
         set_dummy_sensor_values(sim_app, device_type, SensorType.BAROMETER, initial_pres, 25)
         flush_packets(sim_app, device_type)
         initial_altitude = sim_app.rocket_data.last_value_by_device(device_type, DataEntryIds.CALCULATED_ALTITUDE)
@@ -162,7 +193,7 @@ class TestFlare:
                                                             DataEntryIds.BAROMETER_TEMPERATURE) == vals[1]
             assert sim_app.rocket_data.last_value_by_device(device_type,
                                                             DataEntryIds.CALCULATED_ALTITUDE) - initial_altitude == \
-                                                                approx(altitude(vals[0]) - altitude(initial_pres), abs=0.01)
+                                                                approx(baro_altitude(vals[0]) - initial_baro_altitude, abs=0.01)
             assert sim_app.rocket_data.last_value_by_device(device_type,
                                                             DataEntryIds.BAROMETER_TEMPERATURE) == vals[1]
 
@@ -234,132 +265,3 @@ class TestFlare:
             snapshot = get_event_stats_snapshot()
             sim_app.send_command(device_type.name + ".baropres")
             assert SINGLE_SENSOR_EVENT.wait(snapshot, num_expected=1) == 1
-
-
-@pytest.mark.parametrize(
-    "sim_app, device_type", valid_paramitrization(
-        [HollyburnProfile()],
-        only_flare(all_devices(excluding=[]))),
-    indirect=['sim_app'])
-def test_full_flight(qtbot, sim_app, device_type):
-    hw = get_hw_sim(sim_app, device_type)
-
-    flush_packets(sim_app, device_type)
-    assert sim_app.rocket_data.last_value_by_device(device_type, DataEntryIds.STATE) == DataEntryValues.STATE_STANDBY
-
-    sim_app.send_command(device_type.name + ".arm")
-    flush_packets(sim_app, device_type)
-
-    assert sim_app.rocket_data.last_value_by_device(device_type, DataEntryIds.STATE) == DataEntryValues.STATE_ARMED
-
-    hw.launch()
-
-    # Run simulation until complete
-    stuck_count = 0
-    last_time = None
-    while True:
-        time.sleep(1)
-        with hw:
-            if FlightEvent.GROUND_HIT in hw._rocket_sim.get_flight_events():
-                break
-
-            print(
-                f"FLIGHT RUNNING: t = {hw._rocket_sim.get_time()}, alt = {hw._rocket_sim.get_data(FlightDataType.TYPE_ALTITUDE)}")
-
-            if hw._rocket_sim.get_time() != last_time or last_time is None:
-                stuck_count = 0
-            else:
-                stuck_count += 1
-                if stuck_count >= 5:
-                    assert False  # Flight sim stuck
-
-            last_time = hw._rocket_sim.get_time()
-
-    profile = get_profile(sim_app)
-
-    # Define helper function
-    def assert_flight_point(name, flight_point, deployment_time, sim_event, initial_state, final_state):
-        times, alts =  hw._rocket_sim.get_time_series(FlightDataType.TYPE_ALTITUDE)
-        deployment_altitude = np.interp(deployment_time, times, alts)
-
-        # Print some stats
-        deploy_id = f"STATS_{profile.rocket_name.replace(' ', '_').upper()}_{name}"
-        print(f"{deploy_id}_TIME = {deployment_time}")
-        print(f"{deploy_id}_ALTITUDE = {deployment_altitude}")
-
-        # Assert deployment is at expected time and altitude
-        assert abs(deployment_time - flight_point.time) < flight_point.time_tolerance
-        assert abs(deployment_altitude - flight_point.altitude) < flight_point.altitude_tolerance
-
-        # Assert that received igniter fired event at expected time
-        (times, events) = sim_app.rocket_data.time_series_by_device(device_type, DataEntryIds.EVENT)
-        fired = False
-        for i in range(len(times)):
-            if events[i] is DataEntryValues.EVENT_IGNITOR_FIRED and \
-                    abs(times[i] / S_TO_MS - hw._rocket_sim.get_launch_time() - flight_point.time) < flight_point.time_tolerance:
-                fired = True
-                break
-        assert fired
-
-        # Assert that simulation event happened at expected time
-        sim_event_times = hw._rocket_sim.get_flight_events()[sim_event]
-        found_event = False
-        for t in sim_event_times:
-            if abs(t - flight_point.time) < flight_point.time_tolerance:
-                found_event = True
-                break
-        assert found_event
-
-        # Assert states transition at expected time
-        (times, states) = sim_app.rocket_data.time_series_by_device(device_type, DataEntryIds.STATE)
-        transitioned = False
-        for i in range(len(times)):
-            if flight_point.time - flight_point.time_tolerance < times[i] / S_TO_MS - hw._rocket_sim.get_launch_time() < flight_point.time + flight_point.time_tolerance:
-                if states[i] == initial_state and states[i+1] == final_state:
-                    transitioned = True
-                    break
-        assert transitioned
-
-    # Start asserting based on simulation results
-    with hw:
-        assert_flight_point('DROGUE_DEPLOY',
-                            profile.expected_apogee_point,
-                            hw._rocket_sim.get_drogue_deployment_time(),
-                            FlightEvent.APOGEE,
-                            DataEntryValues.STATE_ASCENT_TO_APOGEE,
-                            DataEntryValues.STATE_PRESSURE_DELAY)
-
-        assert_flight_point('MAIN_DEPLOY',
-                            profile.expected_main_deploy_point,
-                            hw._rocket_sim.get_main_deployment_time(),
-                            FlightEvent.RECOVERY_DEVICE_DEPLOYMENT,
-                            DataEntryValues.STATE_DROGUE_DESCENT,
-                            DataEntryValues.STATE_MAIN_DESCENT)
-
-
-@pytest.mark.parametrize("sim_app", valid_paramitrization(all_profiles(excluding=['WbProfile', 'CoPilotProfile'])),
-                         indirect=True)
-def test_clean_shutdown(qtbot, sim_app):
-    assert sim_app.ReadThread.isRunning()
-    assert sim_app.SendThread.isRunning()
-    assert sim_app.MappingThread.isRunning()
-    assert sim_app.MappingThread.map_process.is_alive()
-    assert sim_app.rocket_data.autosave_thread.is_alive()
-    for connection in sim_app.connections.values():
-        assert connection.thread.is_alive()
-        assert connection._xbee._rocket_rx_thread.is_alive()
-        assert connection.rocket.poll() is None
-
-    sim_app.shutdown()
-
-    assert sim_app.ReadThread.isFinished()
-    assert sim_app.SendThread.isFinished()
-    assert sim_app.MappingThread.isFinished()
-    assert not sim_app.rocket_data.autosave_thread.is_alive()
-    for connection in sim_app.connections.values():
-        assert not connection.thread.is_alive()
-        assert not connection._xbee._rocket_rx_thread.is_alive()
-        assert connection.rocket.poll() is not None
-
-    with pytest.raises(ValueError):
-        sim_app.MappingThread.map_process.is_alive()
@@ -0,0 +1,161 @@
+import time
+import pytest
+import numpy as np
+from profiles.rocket_profile import RocketProfile
+from profiles.rockets.hollyburn import HollyburnProfile
+from .integration_utils import (
+    test_app,
+    construct_sim_connection,
+    get_hw_sim,
+    valid_paramitrization,
+    all_devices,
+    all_profiles,
+    only_flare,
+    flush_packets,
+)
+from connections.sim.hw.rocket_sim import FlightEvent, FlightDataType
+from main_window.competition.comp_app import CompApp
+from main_window.data_entry_id import DataEntryIds, DataEntryValues
+
+# SIM tests that leave the app unusable afterwards, and so each need their own app rather than the one shared by the
+# tests in test_sim.py. Kept in a separate module so that the shared app is shut down before these run.
+
+S_TO_MS = int(1e3)
+
+@pytest.fixture(scope="function")
+def sim_app(test_app, request) -> CompApp:
+    profile = request.param
+    return test_app(profile, construct_sim_connection(profile))
+
+
+def get_profile(sim_app) -> RocketProfile:
+    return sim_app.rocket_profile
+
+
+@pytest.mark.parametrize(
+    "sim_app, device_type", valid_paramitrization(
+        [HollyburnProfile()],
+        only_flare(all_devices(excluding=[]))),
+    indirect=['sim_app'])
+def test_full_flight(qtbot, sim_app, device_type):
+    hw = get_hw_sim(sim_app, device_type)
+
+    flush_packets(sim_app, device_type)
+    assert sim_app.rocket_data.last_value_by_device(device_type, DataEntryIds.STATE) == DataEntryValues.STATE_STANDBY
+
+    sim_app.send_command(device_type.name + ".arm")
+    flush_packets(sim_app, device_type)
+
+    assert sim_app.rocket_data.last_value_by_device(device_type, DataEntryIds.STATE) == DataEntryValues.STATE_ARMED
+
+    hw.launch()
+
+    # Run simulation until complete
+    stuck_count = 0
+    last_time = None
+    while True:
+        time.sleep(1)
+        with hw:
+            if FlightEvent.GROUND_HIT in hw._rocket_sim.get_flight_events():
+                break
+
+            print(
+                f"FLIGHT RUNNING: t = {hw._rocket_sim.get_time()}, alt = {hw._rocket_sim.get_data(FlightDataType.TYPE_ALTITUDE)}")
+
+            if hw._rocket_sim.get_time() != last_time or last_time is None:
+                stuck_count = 0
+            else:
+                stuck_count += 1
+                if stuck_count >= 5:
+                    assert False  # Flight sim stuck
+
+            last_time = hw._rocket_sim.get_time()
+
+    profile = get_profile(sim_app)
+
+    # Define helper function
+    def assert_flight_point(name, flight_point, deployment_time, sim_event, initial_state, final_state):
+        times, alts =  hw._rocket_sim.get_time_series(FlightDataType.TYPE_ALTITUDE)
+        deployment_altitude = np.interp(deployment_time, times, alts)
+
+        # Print some stats
+        deploy_id = f"STATS_{profile.rocket_name.replace(' ', '_').upper()}_{name}"
+        print(f"{deploy_id}_TIME = {deployment_time}")
+        print(f"{deploy_id}_ALTITUDE = {deployment_altitude}")
+
+        # Assert deployment is at expected time and altitude
+        assert abs(deployment_time - flight_point.time) < flight_point.time_tolerance
+        assert abs(deployment_altitude - flight_point.altitude) < flight_point.altitude_tolerance
+
+        # Assert that received igniter fired event at expected time
+        (times, events) = sim_app.rocket_data.time_series_by_device(device_type, DataEntryIds.EVENT)
+        fired = False
+        for i in range(len(times)):
+            if events[i] is DataEntryValues.EVENT_IGNITOR_FIRED and \
+                    abs(times[i] / S_TO_MS - hw._rocket_sim.get_launch_time() - flight_point.time) < flight_point.time_tolerance:
+                fired = True
+                break
+        assert fired
+
+        # Assert that simulation event happened at expected time
+        sim_event_times = hw._rocket_sim.get_flight_events()[sim_event]
+        found_event = False
+        for t in sim_event_times:
+            if abs(t - flight_point.time) < flight_point.time_tolerance:
+                found_event = True
+                break
+        assert found_event
+
+        # Assert states transition at expected time
+        (times, states) = sim_app.rocket_data.time_series_by_device(device_type, DataEntryIds.STATE)
+        transitioned = False
+        for i in range(len(times)):
+            if flight_point.time - flight_point.time_tolerance < times[i] / S_TO_MS - hw._rocket_sim.get_launch_time() < flight_point.time + flight_point.time_tolerance:
+                if states[i] == initial_state and states[i+1] == final_state:
+                    transitioned = True
+                    break
+        assert transitioned
+
+    # Start asserting based on simulation results
+    with hw:
+        assert_flight_point('DROGUE_DEPLOY',
+                            profile.expected_apogee_point,
+                            hw._rocket_sim.get_drogue_deployment_time(),
+                            FlightEvent.APOGEE,
+                            DataEntryValues.STATE_ASCENT_TO_APOGEE,
+                            DataEntryValues.STATE_PRESSURE_DELAY)
+
+        assert_flight_point('MAIN_DEPLOY',
+                            profile.expected_main_deploy_point,
+                            hw._rocket_sim.get_main_deployment_time(),
+                            FlightEvent.RECOVERY_DEVICE_DEPLOYMENT,
+                            DataEntryValues.STATE_DROGUE_DESCENT,
+                            DataEntryValues.STATE_MAIN_DESCENT)
+
+
+@pytest.mark.parametrize("sim_app", valid_paramitrization(all_profiles(excluding=['WbProfile', 'CoPilotProfile'])),
+                         indirect=True)
+def test_clean_shutdown(qtbot, sim_app):
+    assert sim_app.ReadThread.isRunning()
+    assert sim_app.SendThread.isRunning()
+    assert sim_app.MappingThread.isRunning()
+    assert sim_app.MappingThread.map_process.is_alive()
+    assert sim_app.rocket_data.autosave_thread.is_alive()
+    for connection in sim_app.connections.values():
+        assert connection.thread.is_alive()
+        assert connection._xbee._rocket_rx_thread.is_alive()
+        assert connection.rocket.poll() is None
+
+    sim_app.shutdown()
+
+    assert sim_app.ReadThread.isFinished()
+    assert sim_app.SendThread.isFinished()
+    assert sim_app.MappingThread.isFinished()
+    assert not sim_app.rocket_data.autosave_thread.is_alive()
+    for connection in sim_app.connections.values():
+        assert not connection.thread.is_alive()
+        assert not connection._xbee._rocket_rx_thread.is_alive()
+        assert connection.rocket.poll() is not None
+
+    with pytest.raises(ValueError):
+        sim_app.MappingThread.map_process.is_alive()